@@ -287,12 +287,12 @@ def ellnorm (mjr, mnr, pa):
     bad = (mjr <= 0) | (mnr <= 0)
     half_pi = 0.5 * np.pi
 
-    # swap major and minor if minor is bigger
-    swap = np.where (mnr > mjr)
-    temp = mnr[swap]
-    mnr[swap] = mjr[swap]
-    mjr[swap] = temp
-    pa[swap] += half_pi
+    # swap major and minor if minor is bigger. We build new arrays rather
+    # than working in-place, since the inputs may be broadcast views or the
+    # caller's own arrays.
+    swap = mnr > mjr
+    mjr, mnr = np.where (swap, mnr, mjr), np.where (swap, mjr, mnr)
+    pa = np.where (swap, pa + half_pi, pa)
 
     # center PA in [-pi/2, +pi/2]
     pa = ((pa + half_pi) % np.pi) - half_pi
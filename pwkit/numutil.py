@@ -19,8 +19,6 @@ import functools
 from six.moves import range
 import numpy as np
 
-from .method_decorator import method_decorator
-
 
 def _broadcastize_spec_to_scalar_filter(s):
     if s is None:
@@ -29,7 +27,7 @@ def _broadcastize_spec_to_scalar_filter(s):
     if s == 0:
         # This return value has the same shape as the input(s). If we
         # promoted to a 1-element vector, we need to demote.
-        return np.asscalar
+        return lambda x: x.item()
     if s == 1:
         # This return value is a larger vector of the input(s). If we promoted
         # from a scalar, we drop the final axis. We asarray() the result for
@@ -39,39 +37,6 @@ def _broadcastize_spec_to_scalar_filter(s):
     raise ValueError('unrecognized @broadcastize ret_spec value %r' % s)
 
 
-class _Broadcaster(method_decorator):
-    # _BroadcasterDecorator must set self._n_arr and _scalar_ret_filter on creation.
-
-    def fixup(self, newobj):
-        # This function is used by the method_decorator superclass.
-        newobj._n_arr = object.__getattribute__(self, '_n_arr')
-        newobj._force_float = object.__getattribute__(self, '_force_float')
-        newobj._scalar_ret_filter = object.__getattribute__(self, '_scalar_ret_filter')
-
-    def __call__(self, *args, **kwargs):
-        n_arr = object.__getattribute__(self, '_n_arr')
-        force_float = object.__getattribute__(self, '_force_float')
-
-        if len(args) < n_arr:
-            raise TypeError('expected at least %d arguments, got %d'
-                             % (n_arr, len(args)))
-
-        bc_raw = np.broadcast_arrays(*args[:n_arr])
-        if force_float:
-            bc_raw = tuple(np.asfarray(a) for a in bc_raw)
-        bc_1d = tuple(np.atleast_1d(a) for a in bc_raw)
-        rest = args[n_arr:]
-        result = super(_Broadcaster, self).__call__(*(bc_1d + rest), **kwargs)
-
-        if bc_raw[0].ndim == 0:
-            # Inputs were all scalars. We need to filter the output(s) to
-            # remove extra axes.
-            scalar_ret_filter = object.__getattribute__(self, '_scalar_ret_filter')
-            result = scalar_ret_filter(result)
-
-        return result
-
-
 class _BroadcasterDecorator(object):
     """Decorator to make functions automatically work on vectorized arguments. See
     the pwkit documentation for usage information.
@@ -93,18 +58,66 @@ class _BroadcasterDecorator(object):
 
 
     def __call__(self, subfunc):
-        b = _Broadcaster(subfunc)
-        b._n_arr = self._n_arr
-        b._force_float = self._force_float
-        b._scalar_ret_filter = self._scalar_ret_filter
-        return b
+        # The wrapper is a plain closure, rather than an object with a
+        # __call__ method, to keep the per-call overhead to a minimum.
+        n_arr = self._n_arr
+        force_float = self._force_float
+        scalar_ret_filter = self._scalar_ret_filter
+
+        @functools.wraps(subfunc)
+        def broadcaster(*args, **kwargs):
+            if len(args) < n_arr:
+                raise TypeError('expected at least %d arguments, got %d'
+                                 % (n_arr, len(args)))
+
+            # Fast path: if the arguments are already plain, non-scalar arrays
+            # of the same shape (and suitable type), they'd come out of the
+            # processing below unchanged, so skip it.
+            shape = getattr(args[0], 'shape', ())
+
+            if len(shape) and all(type(a) is np.ndarray and a.shape == shape and
+                                  (a.dtype.kind in 'fc' or not force_float)
+                                  for a in args[:n_arr]):
+                return subfunc(*args, **kwargs)
+
+            # Converting to float before broadcasting means that we never
+            # convert more elements than were actually passed in. Arguments
+            # that already have the final shape are passed through as-is;
+            # only the others get (zero-copy) broadcast views.
+            # (np.asfarray() would do the float conversion, but it was removed
+            # in Numpy 2.0.)
+            arrs = [np.asarray(a) for a in args[:n_arr]]
+
+            if force_float:
+                arrs = [a if a.dtype.kind in 'fc' else a.astype(np.float64)
+                        for a in arrs]
+
+            shape = np.broadcast(*arrs).shape
+            was_scalar = (shape == ())
+
+            if was_scalar:
+                bc_1d = tuple(a.reshape((1,)) for a in arrs)
+            else:
+                bc_1d = tuple(a if a.shape == shape else np.broadcast_to(a, shape)
+                              for a in arrs)
+
+            result = subfunc(*(bc_1d + args[n_arr:]), **kwargs)
+
+            if was_scalar:
+                # Inputs were all scalars. We need to filter the output(s) to
+                # remove extra axes.
+                result = scalar_ret_filter(result)
+
+            return result
+
+        return broadcaster
 
 broadcastize = _BroadcasterDecorator
 
 
 # Very misc.
 
-def fits_recarray_to_data_frame(recarray, drop_nonscalar_ok=True):
+def fits_recarray_to_data_frame(recarray, drop_nonscalar_ok=True, copy=True):
     """Convert a FITS data table, stored as a Numpy record array, into a Pandas
     DataFrame object. By default, non-scalar columns are discarded, but if
     *drop_nonscalar_ok* is False then a :exc:`ValueError` is raised. Column
@@ -119,29 +132,46 @@ def fits_recarray_to_data_frame(recarray, drop_nonscalar_ok=True):
     little-endian. This seems to be an issue for Pandas DataFrames, where
     ``df[['col1', 'col2']]`` triggers an assertion for me if the underlying
     data are not native-byte-ordered. This function normalizes the read-in
-    data to native endianness to avoid this.
+    data to native endianness to avoid this. If *copy* is true (the default),
+    the DataFrame gets its own copy of the data and *recarray* is left
+    untouched. If it is false, non-native columns are byte-swapped in place
+    and the resulting DataFrame shares memory with *recarray*, which avoids
+    copying large tables but leaves *recarray* itself scrambled.
 
     See also :meth:`pwkit.io.Path.read_fits_bintable`.
 
     """
     from pandas import DataFrame
 
-    def normalize():
-        for column in recarray.columns:
-            n = column.name
-            d = recarray[n]
+    names = []
+    cols = {}
 
-            if d.ndim != 1:
-                if not drop_nonscalar_ok:
-                    raise ValueError('input must have only scalar columns')
-                continue
+    for column in recarray.columns:
+        n = column.name
+        d = recarray[n]
+
+        if d.ndim != 1:
+            if not drop_nonscalar_ok:
+                raise ValueError('input must have only scalar columns')
+            continue
 
-            if d.dtype.isnative:
-                yield (n.lower(), d)
+        # Every column is copied at most once, here, so we can tell Pandas
+        # not to bother.
+
+        if not d.dtype.isnative:
+            native = d.dtype.newbyteorder('=')
+
+            if copy:
+                d = d.astype(native)
             else:
-                yield (n.lower(), d.byteswap(True).newbyteorder())
+                d = d.byteswap(True).view(native)
+        elif copy:
+            d = d.copy()
+
+        names.append(n.lower())
+        cols[n.lower()] = d
 
-    return DataFrame(dict(normalize()))
+    return DataFrame(cols, columns=names, copy=False)
 
 
 def data_frame_to_astropy_table(dataframe):
@@ -218,11 +248,10 @@ def page_data_frame(df, pager_argv=['less'], **kwargs):
 
 # Chunked averaging of data tables
 
-def slice_around_gaps(values, maxgap):
-    """Given an ordered array of values, generate a set of slices that traverse
-    all of the values. Within each slice, no gap between adjacent values is
-    larger than `maxgap`. In other words, these slices break the array into
-    chunks separated by gaps of size larger than maxgap.
+def _find_gap_boundaries(values, maxgap):
+    """Given an ordered array of values, return an array of the indices at which
+    a gap larger than `maxgap` ends. That is, each returned index is the
+    first index of a new chunk.
 
     """
     if not (maxgap > 0):
@@ -232,19 +261,68 @@ def slice_around_gaps(values, maxgap):
     values = np.asarray(values)
     delta = values[1:] - values[:-1]
 
-    if np.any(delta < 0):
+    # Checking the minimum avoids allocating a boolean array just for this
+    # test. We need fmin rather than min() since the latter propagates NaNs,
+    # which would hide any negative steps elsewhere in the array.
+    if delta.size and np.fmin.reduce(delta) < 0:
         raise ValueError('values must be in nondecreasing order')
 
-    whgap = np.where(delta > maxgap)[0] + 1
+    return np.nonzero(delta > maxgap)[0] + 1
+
+
+def slice_around_gaps(values, maxgap):
+    """Given an ordered array of values, generate a set of slices that traverse
+    all of the values. Within each slice, no gap between adjacent values is
+    larger than `maxgap`. In other words, these slices break the array into
+    chunks separated by gaps of size larger than maxgap.
+
+    """
     prev_idx = None
 
-    for gap_idx in whgap:
+    for gap_idx in _find_gap_boundaries(values, maxgap):
         yield slice(prev_idx, gap_idx)
         prev_idx = gap_idx
 
     yield slice(prev_idx, None)
 
 
+def _slice_evenly_with_gaps_bounds(values, target_len, maxgap):
+    """Compute the slices generated by :func:`slice_evenly_with_gaps`,
+    returning them as a tuple ``(starts, stops)`` of integer arrays.
+
+    """
+    if not (target_len > 0):
+        raise ValueError('target_len must be positive; got %r' % target_len)
+
+    values = np.asarray(values)
+    gaps = _find_gap_boundaries(values, maxgap)
+    run_starts = np.concatenate(([0], gaps)).astype(int)
+    run_stops = np.concatenate((gaps, [values.size])).astype(int)
+    starts = [np.zeros(0, dtype=int)]
+    stops = [np.zeros(0, dtype=int)]
+
+    for start, stop in zip(run_starts, run_stops):
+        num_elements = stop - start
+        if num_elements < 1:
+            continue
+
+        nsegments = int(np.floor(float(num_elements) / target_len))
+        nsegments = max(nsegments, 1)
+        nsegments = min(nsegments, num_elements)
+        segment_len = num_elements / nsegments
+
+        # Accumulating the offsets (rather than multiplying) reproduces the
+        # rounding of the original iterative implementation exactly.
+        bounds = np.empty(nsegments + 1, dtype=int)
+        bounds[0] = start
+        bounds[1:] = start + np.round(np.add.accumulate(np.repeat(segment_len, nsegments)))
+        keep = (bounds[1:] > bounds[:-1])
+        starts.append(bounds[:-1][keep])
+        stops.append(bounds[1:][keep])
+
+    return np.concatenate(starts), np.concatenate(stops)
+
+
 def slice_evenly_with_gaps(values, target_len, maxgap):
     """Given an ordered array of values, generate a set of slices that traverse
     all of the values. Each slice contains about `target_len` items. However,
@@ -256,28 +334,46 @@ def slice_evenly_with_gaps(values, target_len, maxgap):
     size uniform within each non-gapped run.
 
     """
-    if not (target_len > 0):
-        raise ValueError('target_len must be positive; got %r' % target_len)
+    starts, stops = _slice_evenly_with_gaps_bounds(values, target_len, maxgap)
 
-    values = np.asarray(values)
-    l = values.size
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        yield slice(start, stop)
 
-    for gapslice in slice_around_gaps(values, maxgap):
-        start, stop, ignored_stride = gapslice.indices(l)
-        num_elements = stop - start
-        nsegments = int(np.floor(float(num_elements) / target_len))
-        nsegments = max(nsegments, 1)
-        nsegments = min(nsegments, num_elements)
-        segment_len = num_elements / nsegments
-        offset = 0.
-        prev = start
 
-        for _ in range(nsegments):
-            offset += segment_len
-            next = start + int(round(offset))
-            if next > prev:
-                yield slice(prev, next)
-            prev = next
+def _reduceat_indices(slicers, n):
+    """Given a list of indexers into an array of length *n*, attempt to compute
+    an index array for :meth:`numpy.ufunc.reduceat` such that the even-indexed
+    elements of its output are the reductions over each indexer's chunk. This
+    is only possible if every indexer is a nonempty, contiguous slice. If
+    that's not the case, None is returned.
+
+    """
+    bounds = []
+
+    for s in slicers:
+        if not isinstance(s, slice):
+            return None
+
+        start, stop, step = s.indices(n)
+        if step != 1 or stop <= start:
+            return None
+
+        bounds += [start, stop]
+
+    if not len(bounds):
+        return None
+
+    # reduceat() runs the final chunk to the end of the array, so the final
+    # bound may be dropped. Any others that point past the end cannot be
+    # expressed.
+
+    if bounds[-1] == n:
+        bounds.pop()
+
+    bounds = np.array(bounds)
+    if np.any(bounds >= n):
+        return None
+    return bounds
 
 
 def reduce_data_frame(df, chunk_slicers,
@@ -318,34 +414,126 @@ def reduce_data_frame(df, chunk_slicers,
     Returns a new :class:`pandas.DataFrame`.
 
     """
-    subds = [df.iloc[idx] for idx in chunk_slicers]
-    subds = [sd for sd in subds if sd.shape[0] >= min_points_per_chunk]
+    import warnings
+
+    # The chunk slicers are Numpy-compatible indexers, so we can apply them
+    # directly to the underlying column arrays rather than creating a
+    # sub-DataFrame for every chunk.
+
+    rowidx = np.arange(df.shape[0])
+    chunks = []
+
+    for idx in chunk_slicers:
+        n = rowidx[idx].size
+        if n >= min_points_per_chunk:
+            chunks.append((idx, n))
+
+    n_chunks = len(chunks)
+    lengths = np.array([n for _, n in chunks], dtype=int)
+
+    # If the chunks are all simple slices, we can reduce every chunk of a
+    # numeric column in one call to a ufunc's reduceat() method. Otherwise we
+    # fall back to looping over the chunks, with NumPy for numeric columns
+    # and with Pandas for everything else (datetimes, strings, complex
+    # numbers, ...), whose reductions NumPy's nan-functions don't reproduce.
+
+    rat = _reduceat_indices([idx for idx, _ in chunks], df.shape[0])
+
+    def can_reduceat(*arrays):
+        return rat is not None and all(a.dtype.kind in 'biuf' for a in arrays)
 
-    chunked = df.__class__({nchunk_colname: np.zeros(len(subds), dtype=np.int)})
+    def reduceat(ufunc, values, **kwargs):
+        return ufunc.reduceat(values, rat, **kwargs)[::2]
+
+    def per_chunk(col, method):
+        values = df[col].values
+
+        if values.dtype.kind in 'biuf':
+            nanfunc = getattr(np, 'nan' + method)
+            result = np.empty(n_chunks)
+            for i, (idx, _) in enumerate(chunks):
+                result[i] = nanfunc(values[idx])
+            return result
+
+        # Other kinds of column (datetimes, strings, complex numbers, ...)
+        # can't go into a float buffer, so leave the reduction to Pandas. The
+        # list gets a suitable dtype when the output DataFrame is assembled.
+        series = df[col]
+        return [getattr(series.iloc[idx], method)() for idx, _ in chunks]
+
+    # Each output column is computed into its own array and the result is
+    # assembled in one go at the end. We track the column order explicitly
+    # for the sake of Pythons whose dicts are unordered.
+
+    colnames = []
+    cols = {}
+
+    def add_column(name, values):
+        if name not in cols:
+            colnames.append(name)
+        cols[name] = values
+
+    add_column(nchunk_colname, lengths)
 
     # Some future-proofing: allow possibility of different ways of mapping
     # from a column giving a value to a column giving its uncertainty.
 
     uncert_col_name = lambda c: uncert_prefix + c
 
-    for i, subd in enumerate(subds):
-        label = chunked.index[i]
-        chunked.loc[label,nchunk_colname] = subd.shape[0]
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        # Like Pandas, we skip NaNs, and silently yield NaN for all-NaN chunks.
+        warnings.simplefilter('ignore', RuntimeWarning)
 
         for col in avg_cols:
-            chunked.loc[label,col] = subd[col].mean()
+            values = df[col].values
+
+            if not can_reduceat(values):
+                add_column(col, per_chunk(col, 'mean'))
+                continue
+
+            if values.dtype.kind == 'f':
+                ok = ~np.isnan(values)
+                counts = reduceat(np.add, ok, dtype=int)
+                values = np.where(ok, values, 0)
+            else:
+                counts = lengths
+
+            add_column(col, reduceat(np.add, values, dtype=np.float64) / counts)
 
         for col in uavg_cols:
             ucol = uncert_col_name(col)
-            v, u = weighted_mean(subd[col], subd[ucol])
-            chunked.loc[label,col] = v
-            chunked.loc[label,ucol] = u
+            values = df[col].values
+            uncerts = df[ucol].values
+
+            if can_reduceat(values) and uncerts.dtype.kind == 'f':
+                weights = uncerts ** -2
+                wt_sum = reduceat(np.add, weights)
+                if np.any(wt_sum == 0):
+                    raise ZeroDivisionError('weights sum to zero, can\'t be normalized')
+                add_column(col, reduceat(np.add, weights * values) / wt_sum)
+                add_column(ucol, wt_sum ** -0.5)
+            else:
+                wavg = np.empty(n_chunks)
+                uwavg = np.empty(n_chunks)
+                for i, (idx, _) in enumerate(chunks):
+                    wavg[i], uwavg[i] = weighted_mean(values[idx], uncerts[idx])
+                add_column(col, wavg)
+                add_column(ucol, uwavg)
 
         for col in minmax_cols:
-            chunked.loc[label, 'min_'+col] = subd[col].min()
-            chunked.loc[label, 'max_'+col] = subd[col].max()
+            values = df[col].values
+
+            if can_reduceat(values):
+                # fmin() and fmax() ignore NaNs unless there's nothing else.
+                add_column('min_'+col, reduceat(np.fmin, values).astype(np.float64))
+                add_column('max_'+col, reduceat(np.fmax, values).astype(np.float64))
+            else:
+                add_column('min_'+col, per_chunk(col, 'min'))
+                add_column('max_'+col, per_chunk(col, 'max'))
 
-    return chunked
+    # All of the columns are freshly created, so there's no need for Pandas
+    # to copy them.
+    return df.__class__(cols, columns=colnames, copy=False)
 
 
 def reduce_data_frame_evenly_with_gaps(df, valcol, target_len, maxgap, **kwargs):
@@ -363,6 +551,27 @@ def reduce_data_frame_evenly_with_gaps(df, valcol, target_len, maxgap, **kwargs)
 
 # Smooth a timeseries with uncertainties
 
+def _convolve_valid(a, window):
+    """Convolve the 1D array *a* with the 1D array *window*, returning only the
+    "valid" part of the result.
+
+    The convolution is always computed directly, with :func:`numpy.convolve`,
+    rather than with an FFT. The round-off error of an FFT convolution scales
+    with the largest value in the input, so when the smoothing weights span a
+    wide dynamic range the smaller outputs can be swamped, or even come out
+    negative or zero.
+
+    """
+    a = np.asarray(a)
+
+    if a.size < window.size:
+        # No valid outputs. np.convolve() would silently swap its arguments
+        # here, which isn't what we want.
+        return np.empty((0,))
+
+    return np.convolve(a, window, mode='valid')
+
+
 def usmooth(window, uncerts, *data, **kwargs):
     """Smooth data series according to a window, weighting based on uncertainties.
 
@@ -387,7 +596,9 @@ def usmooth(window, uncerts, *data, **kwargs):
         u, x, y = numutil.usmooth(np.hamming(7), u, x, y)
 
     """
-    window = np.asarray(window)
+    # The window is used in several convolutions, so convert it once.
+    window = np.ascontiguousarray(window, dtype=np.float64)
+    window_sq = window**2
     uncerts = np.asarray(uncerts)
 
     # Hacky keyword argument handling because you can't write "def foo(*args,
@@ -404,16 +615,21 @@ def usmooth(window, uncerts, *data, **kwargs):
     if k is None:
         k = window.size
 
-    conv = lambda q, r: np.convolve(q, r, mode='valid')
-
     if uncerts is None:
         w = np.ones_like(x)
     else:
-        w = uncerts ** -2
+        w = 1. / (uncerts * uncerts) # faster than uncerts**-2
+
+    cw = _convolve_valid(w, window)
+    cu = np.sqrt(_convolve_valid(w, window_sq)) / cw
+    result = [cu]
 
-    cw = conv(w, window)
-    cu = np.sqrt(conv(w, window**2)) / cw
-    result = [cu] + [conv(w * np.asarray(x), window) / cw for x in data]
+    for x in data:
+        # The series are smoothed one at a time, rather than stacked, so that
+        # stacking can't change the dtype that each one is computed in.
+        sx = _convolve_valid(w * np.asarray(x), window)
+        sx /= cw
+        result.append(sx)
 
     if k != 1:
         result = [x[::k] for x in result]
@@ -449,12 +665,15 @@ def dfsmooth(window, df, ucol, k=None):
     """
     import pandas as pd
 
+    window = np.ascontiguousarray(window, dtype=np.float64)
+    window_sq = window**2
+
     if k is None:
         k = window.size
 
-    conv = lambda q, r: np.convolve(q, r, mode='valid')
-    w = df[ucol] ** -2
-    invcw = 1. / conv(w, window)
+    u = df[ucol].values
+    w = 1. / (u * u) # faster than u**-2
+    invcw = 1. / _convolve_valid(w, window)
 
     # XXX: we're not smoothing the index.
 
@@ -462,9 +681,9 @@ def dfsmooth(window, df, ucol, k=None):
 
     for col in df.columns:
         if col == ucol:
-            res[col] = np.sqrt(conv(w, window**2)) * invcw
+            res[col] = np.sqrt(_convolve_valid(w, window_sq)) * invcw
         else:
-            res[col] = conv(w * df[col], window) * invcw
+            res[col] = _convolve_valid(w * df[col].values, window) * invcw
 
     res = pd.DataFrame(res)
     return res[::k]
@@ -520,8 +739,52 @@ def smooth_data_frame_with_gaps(
 # Parallelized versions of various routines that don't operate vectorially
 # even though sometimes it'd be nice to pretend that they do.
 
+def _vectorized_newton(func, fprime, jac_with_func, x0, tol, maxiter, par_args,
+                       simple_args):
+    """Run Newton-Raphson iterations for an array of starting points at once. The
+    array arguments must already have been broadcast to a common shape. The
+    iteration and convergence test follow the scalar
+    :func:`scipy.optimize.newton`, with converged elements frozen in place
+    while the others continue.
+
+    """
+    x = np.array(x0, dtype=float)
+    args = tuple(par_args) + simple_args
+    active = np.ones(x.shape, dtype=bool)
+
+    for i in range(int(maxiter.max())):
+        if jac_with_func:
+            f, fp = func(x, *args)
+        else:
+            f = func(x, *args)
+            fp = fprime(x, *args)
+
+        f = np.broadcast_to(f, x.shape)
+        fp = np.broadcast_to(fp, x.shape)
+        at_zero = (f == 0)
+
+        if np.any(active & ~at_zero & (fp == 0)):
+            raise RuntimeError('derivative was zero')
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.where(active & ~at_zero, f / fp, 0.)
+
+        x -= step
+        active &= ~(np.abs(step) < tol)
+
+        if not active.any():
+            break
+
+        if np.any(active & (i + 1 >= maxiter)):
+            raise RuntimeError('failed to converge after %d iterations'
+                               % (i + 1))
+
+    return x
+
+
 def parallel_newton(func, x0, fprime=None, par_args=(), simple_args=(), tol=1.48e-8,
-                    maxiter=50, parallel=True, **kwargs):
+                    maxiter=50, parallel=True, vectorized=False, jac_with_func=False,
+                    **kwargs):
     """A parallelized version of :func:`scipy.optimize.newton`.
 
     Arguments:
@@ -543,6 +806,16 @@ def parallel_newton(func, x0, fprime=None, par_args=(), simple_args=(), tol=1.48
     parallel
       Controls parallelization; default uses all available cores. See
       :func:`pwkit.parallel.make_parallel_helper`.
+    vectorized
+      If true, instead of doing a separate zero search for each element,
+      iterate on all of them at once. In this case *func* and *fprime* are
+      called with full arrays and must operate on them elementwise, *fprime*
+      (or *jac_with_func*) must be given, *parallel* is ignored, and no
+      *kwargs* are allowed.
+    jac_with_func
+      If true, *func* returns a tuple ``(f, fprime)`` of the function and its
+      derivative, and *fprime* should not be given. With *vectorized*, this
+      saves a function evaluation per iteration when the two can share work.
     kwargs
       Passed to :func:`scipy.optimize.newton`.
 
@@ -579,28 +852,121 @@ def parallel_newton(func, x0, fprime=None, par_args=(), simple_args=(), tol=1.48
     if not isinstance(simple_args, tuple):
         raise ValueError('simple_args must be a tuple')
 
+    if jac_with_func and fprime is not None:
+        raise ValueError('fprime may not be given if jac_with_func is true')
+
     bc_raw = np.broadcast_arrays(x0, tol, maxiter, *par_args)
     bc_1d = tuple(np.atleast_1d(a) for a in bc_raw)
 
-    def gen_var_args():
-        for i in range(bc_1d[0].size):
-            yield tuple(x.flat[i] for x in bc_1d)
+    if vectorized:
+        if fprime is None and not jac_with_func:
+            raise ValueError('vectorized Newton iteration requires fprime')
+        if len(kwargs):
+            raise TypeError('parallel_newton() does not accept extra keyword arguments '
+                            'if vectorized is true')
 
-    def helper(i, _, var_args):
-        x0, tol, maxiter = var_args[:3]
-        args = var_args[3:] + simple_args
-        return newton(func, x0, fprime=fprime, args=args, tol=tol,
-                       maxiter=maxiter, **kwargs)
+        result = _vectorized_newton(func, fprime, jac_with_func, bc_1d[0],
+                                    bc_1d[1], bc_1d[2], bc_1d[3:], simple_args)
+    else:
+        if jac_with_func:
+            f = lambda *args: func(*args)[0]
+            fp = lambda *args: func(*args)[1]
+        else:
+            f, fp = func, fprime
 
-    with phelp.get_ppmap() as ppmap:
-        result = np.asarray(ppmap(helper, None, gen_var_args()))
+        def gen_var_args():
+            for i in range(bc_1d[0].size):
+                yield tuple(x.flat[i] for x in bc_1d)
+
+        def helper(i, _, var_args):
+            x0, tol, maxiter = var_args[:3]
+            args = var_args[3:] + simple_args
+            return newton(f, x0, fprime=fp, args=args, tol=tol,
+                           maxiter=maxiter, **kwargs)
+
+        with phelp.get_ppmap() as ppmap:
+            result = np.asarray(ppmap(helper, None, gen_var_args()))
 
     if bc_raw[0].ndim == 0:
-        return np.asscalar(result)
+        return result.item()
     return result
 
 
-def parallel_quad(func, a, b, par_args=(), simple_args=(), parallel=True, **kwargs):
+# Abscissae and weights of the 21-point Gauss-Kronrod rule on [-1, 1], from
+# QUADPACK's QK21. Only the nonnegative half is tabulated; the odd-indexed
+# abscissae (counting from 0) are those of the embedded 10-point Gauss rule.
+
+_gk21_xgk = np.array([
+    0.995657163025808080735527280689003,
+    0.973906528517171720077964012084452,
+    0.930157491355708226001207180059508,
+    0.865063366688984510732096688423493,
+    0.780817726586416897063717578345042,
+    0.679409568299024406234327365114874,
+    0.562757134668604683339000099272694,
+    0.433395394129247190799265943165784,
+    0.294392862701460198131126603103866,
+    0.148874338981631210884826001129720,
+    0.000000000000000000000000000000000,
+])
+
+_gk21_wgk = np.array([
+    0.011694638867371874278064396062192,
+    0.032558162307964727478818972459390,
+    0.054755896574351996031381300244580,
+    0.075039674810919952767043140916190,
+    0.093125454583697605535065465083366,
+    0.109387158802297641899210590325805,
+    0.123491976262065851077208977467561,
+    0.134709217311473325928054001771707,
+    0.142775938577060080797094273138717,
+    0.147739104901338491374841515972068,
+    0.149445554002916905664936468389821,
+])
+
+_gk21_wg = np.array([
+    0.066671344308688137593568809893332,
+    0.149451349150580593145776339657697,
+    0.219086362515982043995534934228163,
+    0.269266719309996355091226921569469,
+    0.295524224714752870173892994651338,
+])
+
+_gk21_nodes = np.concatenate((-_gk21_xgk, _gk21_xgk[-2::-1]))
+_gk21_kweights = np.concatenate((_gk21_wgk, _gk21_wgk[-2::-1]))
+_gk21_gweights = np.zeros(21)
+_gk21_gweights[1:10:2] = _gk21_wg
+_gk21_gweights[11::2] = _gk21_wg[::-1]
+
+
+def _vectorized_gk21(func, a, b, par_args, simple_args):
+    """Integrate with the 21-point Gauss-Kronrod rule, evaluating *func* for all
+    integrals in a single call. The array arguments must already have been
+    broadcast to a common shape. Returns ``(integrals, errors)``, where the
+    errors are the absolute differences between the Kronrod and Gauss
+    estimates.
+
+    """
+    if not (np.all(np.isfinite(a)) and np.all(np.isfinite(b))):
+        raise ValueError('vectorized integration requires finite bounds')
+
+    center = 0.5 * (a + b)
+    halfwidth = 0.5 * (b - a)
+
+    # The abscissae go along a new final axis, which we need to add to the
+    # parallelized arguments too so that everything broadcasts.
+
+    x = center[...,np.newaxis] + halfwidth[...,np.newaxis] * _gk21_nodes
+    args = tuple(p[...,np.newaxis] for p in par_args) + simple_args
+    fvals = np.broadcast_to(func(x, *args), x.shape)
+
+    kronrod = halfwidth * np.dot(fvals, _gk21_kweights)
+    gauss = halfwidth * np.dot(fvals, _gk21_gweights)
+    return kronrod, np.abs(kronrod - gauss)
+
+
+def parallel_quad(func, a, b, par_args=(), simple_args=(), parallel=True,
+                  vectorized=False, **kwargs):
     """A parallelized version of :func:`scipy.integrate.quad`.
 
     Arguments are:
@@ -618,6 +984,10 @@ def parallel_quad(func, a, b, par_args=(), simple_args=(), parallel=True, **kwar
     parallel
       Controls parallelization; default uses all available cores. See
       :func:`pwkit.parallel.make_parallel_helper`.
+    vectorized
+      If true, instead of running :func:`scipy.integrate.quad` for each
+      integral, apply a fixed 21-point Gauss-Kronrod rule to all of them at
+      once; see below.
     kwargs
       Passed to :func:`scipy.integrate.quad`. Don't set *full_output* to True.
 
@@ -658,6 +1028,15 @@ def parallel_quad(func, a, b, par_args=(), simple_args=(), parallel=True, **kwar
 
     In all cases the unused fourth parameter *q* is ``'hello'``.
 
+    If *vectorized* is true, *func* is called only once, with *x* and the
+    items of *par_args* given as arrays with a trailing axis of length 21
+    holding the quadrature abscissae. It must therefore operate elementwise.
+    The integrals are computed with a single, non-adaptive 21-point
+    Gauss-Kronrod rule, and the error estimates are the absolute differences
+    from the embedded 10-point Gauss rule. This is much faster but is only
+    appropriate for smooth integrands over finite intervals. In this mode
+    *parallel* is ignored and *kwargs* are not allowed.
+
     """
     from scipy.integrate import quad
 
@@ -673,6 +1052,17 @@ def parallel_quad(func, a, b, par_args=(), simple_args=(), parallel=True, **kwar
     bc_raw = np.broadcast_arrays(a, b, *par_args)
     bc_1d = tuple(np.atleast_1d(a) for a in bc_raw)
 
+    if vectorized:
+        if len(kwargs):
+            raise TypeError('parallel_quad() does not accept extra keyword arguments '
+                            'if vectorized is true')
+
+        result_arr = np.array(_vectorized_gk21(func, bc_raw[0], bc_raw[1],
+                                               bc_raw[2:], simple_args))
+        if bc_raw[0].ndim == 0:
+            return result_arr.reshape((2,))
+        return result_arr
+
     def gen_var_args():
         for i in range(bc_1d[0].size):
             yield tuple(x.flat[i] for x in bc_1d)
@@ -687,16 +1077,25 @@ def parallel_quad(func, a, b, par_args=(), simple_args=(), parallel=True, **kwar
     if bc_raw[0].ndim == 0:
         return np.asarray(result_list[0])
 
-    result_arr = np.empty((2,) + bc_raw[0].shape)
-    for i in range(bc_1d[0].size):
-        result_arr[0].flat[i], result_arr[1].flat[i] = result_list[i]
-    return result_arr
+    # The list of (integral, error) pairs becomes a (N,2) array in a single
+    # conversion; transposing gives us the layout we want.
+    result_arr = np.asarray(result_list, dtype=np.float64)
+    return result_arr.T.reshape((2,) + bc_raw[0].shape)
 
 
 # Some miscellaneous numerical tools
 
+# In these functions, np.dot() is used where possible to fuse the
+# multiplications and sums without allocating array-sized temporaries.
+
 def rms(x):
     """Return the square root of the mean of the squares of ``x``."""
+    x = np.asarray(x)
+
+    if x.dtype.kind == 'f' and x.size:
+        x = x.ravel()
+        return np.sqrt(np.dot(x, x) / x.size)
+
     return np.sqrt(np.square(x).mean())
 
 
@@ -704,6 +1103,13 @@ def weighted_mean(values, uncerts, **kwargs):
     values = np.asarray(values)
     uncerts = np.asarray(uncerts)
     weights = uncerts ** -2
+
+    if not len(kwargs) and values.ndim == 1 and values.shape == weights.shape:
+        wt_sum = weights.sum()
+        if wt_sum == 0:
+            raise ZeroDivisionError('weights sum to zero, can\'t be normalized')
+        return np.dot(weights, values) / wt_sum, wt_sum ** -0.5
+
     wt_mean, wt_sum = np.average(values, weights=weights, returned=True, **kwargs)
     return wt_mean, wt_sum ** -0.5
 
@@ -730,6 +1136,18 @@ def weighted_variance(x, weights):
     if n < 3:
         raise ValueError('cannot calculate meaningful variance of fewer '
                          'than three samples')
+
+    x = np.asarray(x)
+    weights = np.asarray(weights)
+
+    if x.ndim == 1 and weights.shape == x.shape:
+        wt_sum = weights.sum()
+        if wt_sum == 0:
+            raise ZeroDivisionError('weights sum to zero, can\'t be normalized')
+        resid = x - np.dot(weights, x) / wt_sum
+        resid *= resid
+        return np.dot(weights, resid) / wt_sum * n / (n - 1)
+
     wt_mean = np.average(x, weights=weights)
     return np.average(np.square(x - wt_mean), weights=weights) * n / (n - 1)
 
@@ -742,30 +1160,39 @@ def weighted_variance(x, weights):
 # We're careful with inclusivity/exclusivity of the bounds since that can be
 # important.
 
-def unit_tophat_ee(x):
-    """Tophat function on the unit interval, left-exclusive and right-exclusive.
-    Returns 1 if 0 < x < 1, 0 otherwise.
+def _tophat(x, lower, upper, lower_cmp, upper_cmp):
+    """Shared implementation of the tophat functions. *lower_cmp* and
+    *upper_cmp* are :func:`numpy.less` or :func:`numpy.less_equal`, depending
+    on whether each bound is exclusive or inclusive.
 
     """
     x = np.asarray(x)
-    x1 = np.atleast_1d(x)
-    r = ((0 < x1) & (x1 < 1)).astype(x.dtype)
+
     if x.ndim == 0:
-        return np.asscalar(r)
+        return x.dtype.type(lower_cmp(lower, x) and upper_cmp(x, upper)).item()
+
+    # The first comparison writes its result straight into the output array,
+    # which is a safe cast from bool for any numeric dtype. That leaves just
+    # one boolean temporary and avoids a separate final cast.
+    r = lower_cmp(lower, x, out=np.empty(x.shape, dtype=x.dtype))
+    r *= upper_cmp(x, upper)
     return r
 
 
+def unit_tophat_ee(x):
+    """Tophat function on the unit interval, left-exclusive and right-exclusive.
+    Returns 1 if 0 < x < 1, 0 otherwise.
+
+    """
+    return _tophat(x, 0, 1, np.less, np.less)
+
+
 def unit_tophat_ei(x):
     """Tophat function on the unit interval, left-exclusive and right-inclusive.
     Returns 1 if 0 < x <= 1, 0 otherwise.
 
     """
-    x = np.asarray(x)
-    x1 = np.atleast_1d(x)
-    r = ((0 < x1) & (x1 <= 1)).astype(x.dtype)
-    if x.ndim == 0:
-        return np.asscalar(r)
-    return r
+    return _tophat(x, 0, 1, np.less, np.less_equal)
 
 
 def unit_tophat_ie(x):
@@ -773,12 +1200,7 @@ def unit_tophat_ie(x):
     Returns 1 if 0 <= x < 1, 0 otherwise.
 
     """
-    x = np.asarray(x)
-    x1 = np.atleast_1d(x)
-    r = ((0 <= x1) & (x1 < 1)).astype(x.dtype)
-    if x.ndim == 0:
-        return np.asscalar(r)
-    return r
+    return _tophat(x, 0, 1, np.less_equal, np.less)
 
 
 def unit_tophat_ii(x):
@@ -786,12 +1208,7 @@ def unit_tophat_ii(x):
     Returns 1 if 0 <= x <= 1, 0 otherwise.
 
     """
-    x = np.asarray(x)
-    x1 = np.atleast_1d(x)
-    r = ((0 <= x1) & (x1 <= 1)).astype(x.dtype)
-    if x.ndim == 0:
-        return np.asscalar(r)
-    return r
+    return _tophat(x, 0, 1, np.less_equal, np.less_equal)
 
 
 def make_tophat_ee(lower, upper):
@@ -805,12 +1222,7 @@ def make_tophat_ee(lower, upper):
         raise ValueError('"upper" argument must be finite number; got %r' % upper)
 
     def range_tophat_ee(x):
-        x = np.asarray(x)
-        x1 = np.atleast_1d(x)
-        r = ((lower < x1) & (x1 < upper)).astype(x.dtype)
-        if x.ndim == 0:
-            return np.asscalar(r)
-        return r
+        return _tophat(x, lower, upper, np.less, np.less)
 
     range_tophat_ee.__doc__ = ('Ranged tophat function, left-exclusive and '
                                'right-exclusive. Returns 1 if %g < x < %g, '
@@ -829,12 +1241,7 @@ def make_tophat_ei(lower, upper):
         raise ValueError('"upper" argument must be finite number; got %r' % upper)
 
     def range_tophat_ei(x):
-        x = np.asarray(x)
-        x1 = np.atleast_1d(x)
-        r = ((lower < x1) & (x1 <= upper)).astype(x.dtype)
-        if x.ndim == 0:
-            return np.asscalar(r)
-        return r
+        return _tophat(x, lower, upper, np.less, np.less_equal)
 
     range_tophat_ei.__doc__ = ('Ranged tophat function, left-exclusive and '
                                'right-inclusive. Returns 1 if %g < x <= %g, '
@@ -853,12 +1260,7 @@ def make_tophat_ie(lower, upper):
         raise ValueError('"upper" argument must be finite number; got %r' % upper)
 
     def range_tophat_ie(x):
-        x = np.asarray(x)
-        x1 = np.atleast_1d(x)
-        r = ((lower <= x1) & (x1 < upper)).astype(x.dtype)
-        if x.ndim == 0:
-            return np.asscalar(r)
-        return r
+        return _tophat(x, lower, upper, np.less_equal, np.less)
 
     range_tophat_ie.__doc__ = ('Ranged tophat function, left-inclusive and '
                                'right-exclusive. Returns 1 if %g <= x < %g, '
@@ -877,12 +1279,7 @@ def make_tophat_ii(lower, upper):
         raise ValueError('"upper" argument must be finite number; got %r' % upper)
 
     def range_tophat_ii(x):
-        x = np.asarray(x)
-        x1 = np.atleast_1d(x)
-        r = ((lower <= x1) & (x1 <= upper)).astype(x.dtype)
-        if x.ndim == 0:
-            return np.asscalar(r)
-        return r
+        return _tophat(x, lower, upper, np.less_equal, np.less_equal)
 
     range_tophat_ii.__doc__ = ('Ranged tophat function, left-inclusive and '
                                'right-inclusive. Returns 1 if %g <= x <= %g, '
@@ -892,6 +1289,20 @@ def make_tophat_ii(lower, upper):
 
 # Step functions
 
+def _step(x, transition, cmp):
+    """Shared implementation of the step functions. *cmp* is
+    :func:`numpy.greater` or :func:`numpy.greater_equal`, depending on the
+    desired continuity.
+
+    """
+    x = np.asarray(x)
+
+    if x.ndim == 0:
+        return x.dtype.type(cmp(x, transition)).item()
+
+    return cmp(x, transition, out=np.empty(x.shape, dtype=x.dtype))
+
+
 def make_step_lcont(transition):
     """Return a ufunc-like step function that is left-continuous. Returns 1 if
     x > transition, 0 otherwise.
@@ -901,12 +1312,7 @@ def make_step_lcont(transition):
         raise ValueError('"transition" argument must be finite number; got %r' % transition)
 
     def step_lcont(x):
-        x = np.asarray(x)
-        x1 = np.atleast_1d(x)
-        r = (x1 > transition).astype(x.dtype)
-        if x.ndim == 0:
-            return np.asscalar(r)
-        return r
+        return _step(x, transition, np.greater)
 
     step_lcont.__doc__ = ('Left-continuous step function. Returns 1 if x > %g, '
                           '0 otherwise.') % (transition,)
@@ -922,12 +1328,7 @@ def make_step_rcont(transition):
         raise ValueError('"transition" argument must be finite number; got %r' % transition)
 
     def step_rcont(x):
-        x = np.asarray(x)
-        x1 = np.atleast_1d(x)
-        r = (x1 >= transition).astype(x.dtype)
-        if x.ndim == 0:
-            return np.asscalar(r)
-        return r
+        return _step(x, transition, np.greater_equal)
 
     step_rcont.__doc__ = ('Right-continuous step function. Returns 1 if x >= '
                           '%g, 0 otherwise.') % (transition,)
@@ -222,8 +222,8 @@ def interpolated_halfmax_points(x, y):
     x1 = fmin(lambda x: (terp(x) - halfmax)**2, x[guess1], disp=False)
     x2 = fmin(lambda x: (terp(x) - halfmax)**2, x[guess2], disp=False)
 
-    x1 = np.asscalar(x1)
-    x2 = np.asscalar(x2)
+    x1 = x1.item()
+    x2 = x2.item()
 
     if x1 == x2:
         raise PKError('halfmax finding failed')